@@ -11,175 +11,159 @@ in n8n workflow JSON files, including:
 - Error handling nodes and fallback mechanisms
 """
 
+import hashlib
 import json
 import os
-import glob
+import re
+import stat
 import logging
-from typing import Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder/decoder
+    orjson = None
+
+# Per-directory record of workflows already processed, for incremental runs.
+# The leading dot keeps it out of the workflow file scan.
+_CACHE_FILE = '.enhance_cache.json'
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class N8nWorkflowEnhancer:
-    """Enhances n8n workflows with robust error handling"""
+# Keyword sets used to classify HTTP nodes. These are plain substring
+# matches (e.g. "ai" also matches "email").
+_AI_KEYS = frozenset(('openai', 'gpt', 'ai', 'ml'))
+_AI_RETRY_KEYS = frozenset(('openai', 'gpt', 'ai'))
+_GPT_KEYS = frozenset(('openai', 'gpt'))
+_EMAIL_KEYS = frozenset(('email', 'sendgrid', 'mail'))
+_EMAIL_DELIVERY_KEYS = frozenset(('email', 'sendgrid'))
+_WEBHOOK_KEYS = frozenset(('webhook', 'callback', 'dashboard'))
+_CALLBACK_KEYS = frozenset(('webhook', 'callback'))
+_SLACK_KEYS = frozenset(('slack',))
+_SOCIAL_KEYS = frozenset(('twitter', 'facebook', 'linkedin', 'instagram'))
+_ECOMMERCE_KEYS = frozenset(('shopify', 'amazon', 'ebay'))
+_CRITICAL_KEYS = frozenset(('critical', 'important', 'sync'))
+_NOTIFICATION_KEYS = frozenset(('notification', 'alert', 'email'))
+
+_ALL_KEYS = (
+    _AI_KEYS | _EMAIL_KEYS | _WEBHOOK_KEYS | _SLACK_KEYS | _SOCIAL_KEYS |
+    _ECOMMERCE_KEYS | _CRITICAL_KEYS | _NOTIFICATION_KEYS
+)
+
+# One alternation of every keyword, wrapped in a lookahead so a single scan
+# reports overlapping hits too ("email" yields both "email" and "ai"). This
+# relies on no keyword being a prefix of another, so that at most one can
+# match at each position; otherwise the shorter one would hide the longer.
+_PREFIX_KEYS = sorted(
+    (a, b) for a in _ALL_KEYS for b in _ALL_KEYS if a != b and b.startswith(a)
+)
+if _PREFIX_KEYS:
+    raise ValueError(f"Classification keywords must not prefix each other: {_PREFIX_KEYS}")
+_KEYWORD_RE = re.compile('(?=(%s))' % '|'.join(sorted(_ALL_KEYS)))
+
+# Retry configurations by operation type
+_CRITICAL_RETRY = {"enabled": True, "maxAttempts": 3, "waitBetween": 2000}
+_AI_RETRY = {"enabled": True, "maxAttempts": 2, "waitBetween": 3000}
+_NOTIFICATION_RETRY = {"enabled": True, "maxAttempts": 3, "waitBetween": 1000}
+_DEFAULT_RETRY = {"enabled": True, "maxAttempts": 3, "waitBetween": 1500}
+
+_HTTP_REQUEST_TYPE = 'n8n-nodes-base.httpRequest'
+
+# Response and redirect options set on every HTTP node. Nodes share these by
+# reference; they are only serialized, never mutated.
+_RESPONSE_OPTIONS = {"response": {"neverError": False}}
+_REDIRECT_OPTIONS = {"followRedirects": True, "maxRedirects": 3}
+
+# Classification rules as (node name keywords, URL keywords, value), checked in
+# priority order; the first rule with a keyword present wins.
+_TIMEOUT_RULES = (
+    # AI/ML operations need longer timeouts
+    (_AI_KEYS, None, 30000),
+    # Email sending operations
+    (_EMAIL_KEYS, None, 15000),
+    # Webhook/dashboard callbacks
+    (_WEBHOOK_KEYS, None, 15000),
+    # Social media APIs
+    (None, _SOCIAL_KEYS, 20000),
+    # Slack notifications
+    (_SLACK_KEYS, _SLACK_KEYS, 10000),
+    # E-commerce APIs (tend to be slower)
+    (None, _ECOMMERCE_KEYS, 25000),
+)
+
+_RETRY_RULES = (
+    # Critical operations get more retries
+    (_CRITICAL_KEYS, None, _CRITICAL_RETRY),
+    # AI operations get fewer retries due to cost
+    (_AI_RETRY_KEYS, None, _AI_RETRY),
+    # Notifications can have quick retries
+    (_NOTIFICATION_KEYS, None, _NOTIFICATION_RETRY),
+)
+
+_SPECIFIC_IMPROVEMENT_RULES = (
+    (_GPT_KEYS, None, "Added cost-aware retry logic for AI API calls"),
+    (_EMAIL_DELIVERY_KEYS, None, "Enhanced email delivery reliability with retry logic"),
+    (_SLACK_KEYS, _SLACK_KEYS, "Improved Slack notification reliability"),
+    (None, _ECOMMERCE_KEYS, "Added robust error handling for e-commerce API integration"),
+    (_CALLBACK_KEYS, None, "Enhanced webhook reliability with proper timeout and retry"),
+)
+
+def _keywords(text: str) -> frozenset:
+    """Return every classification keyword found in the lowercased text"""
+    return frozenset(m.group(1) for m in _KEYWORD_RE.finditer(text))
+
+def _match_rule(rules, node_keys: frozenset, url_keys: frozenset, default: Any) -> Any:
+    """Return the value of the first rule whose keywords occur in the name or URL"""
+    for name_keys, url_rule_keys, value in rules:
+        if (name_keys is not None and not name_keys.isdisjoint(node_keys)) or \
+                (url_rule_keys is not None and not url_rule_keys.isdisjoint(url_keys)):
+            return value
+    return default
+
+def _timeout_reason(timeout: int) -> str:
+    """Get human-readable reason for timeout configuration"""
+    if timeout >= 30000:
+        return "Extended timeout for AI/ML operations"
+    elif timeout >= 25000:
+        return "Long timeout for e-commerce API operations"
+    elif timeout >= 20000:
+        return "Medium timeout for social media APIs"
+    elif timeout >= 15000:
+        return "Standard timeout for webhook/dashboard operations"
+    else:
+        return "Quick timeout for simple operations"
+
+# Node names and URLs repeat heavily across a workflow directory, so results
+# are cached per worker process. The returned retry config is the shared
+# template and must be copied before use.
+#
+# This is string matching over dicts, so Numba (numeric loops over arrays)
+# and PyPy buy nothing here; JSON I/O dominates at the sizes this script sees.
+# If the corpus ever reaches tens of thousands of HTTP nodes, this function is
+# the seam for a native batch classifier (e.g. a pyo3 extension running one
+# Aho-Corasick pass over all keywords) returning the same tuples.
+@lru_cache(maxsize=4096)
+def _classify_lowered(node_lower: str, url_lower: str) -> Tuple[int, Dict[str, Any], str, str]:
+    """Classify a lowercased node name and URL into (timeout, retry, reason, specific improvement)"""
+    node_keys = _keywords(node_lower)
+    url_keys = _keywords(url_lower) if url_lower else frozenset()
     
-    def __init__(self, workflows_dir: str):
-        self.workflows_dir = workflows_dir
-        self.improvements_made = []
-        
-    def get_timeout_config(self, node_name: str, url: str) -> int:
-        """Determine appropriate timeout based on operation type"""
-        node_lower = node_name.lower()
-        url_lower = url.lower() if url else ""
-        
-        # AI/ML operations need longer timeouts
-        if any(keyword in node_lower for keyword in ['openai', 'gpt', 'ai', 'ml']):
-            return 30000
-        
-        # Email sending operations
-        if any(keyword in node_lower for keyword in ['email', 'sendgrid', 'mail']):
-            return 15000
-            
-        # Webhook/dashboard callbacks
-        if any(keyword in node_lower for keyword in ['webhook', 'callback', 'dashboard']):
-            return 15000
-            
-        # Social media APIs
-        if any(keyword in url_lower for keyword in ['twitter', 'facebook', 'linkedin', 'instagram']):
-            return 20000
-            
-        # Slack notifications
-        if 'slack' in node_lower or 'slack' in url_lower:
-            return 10000
-            
-        # E-commerce APIs (tend to be slower)
-        if any(keyword in url_lower for keyword in ['shopify', 'amazon', 'ebay']):
-            return 25000
-            
-        # Default timeout
-        return 15000
-        
-    def get_retry_config(self, node_name: str, url: str) -> Dict[str, Any]:
-        """Get retry configuration based on operation type"""
-        node_lower = node_name.lower()
-        url_lower = url.lower() if url else ""
-        
-        # Critical operations get more retries
-        if any(keyword in node_lower for keyword in ['critical', 'important', 'sync']):
-            return {
-                "enabled": True,
-                "maxAttempts": 3,
-                "waitBetween": 2000
-            }
-            
-        # AI operations get fewer retries due to cost
-        if any(keyword in node_lower for keyword in ['openai', 'gpt', 'ai']):
-            return {
-                "enabled": True,
-                "maxAttempts": 2,
-                "waitBetween": 3000
-            }
-            
-        # Notifications can have quick retries
-        if any(keyword in node_lower for keyword in ['notification', 'alert', 'email']):
-            return {
-                "enabled": True,
-                "maxAttempts": 3,
-                "waitBetween": 1000
-            }
-            
-        # Default retry config
-        return {
-            "enabled": True,
-            "maxAttempts": 3,
-            "waitBetween": 1500
-        }
-        
-    def get_enhanced_headers(self, existing_headers: Dict[str, str], url: str) -> Dict[str, str]:
-        """Add robust headers to HTTP requests"""
-        headers = existing_headers.copy() if existing_headers else {}
-        
-        # Always add user agent if not present
-        if 'User-Agent' not in headers:
-            headers['User-Agent'] = 'n8n-workflow/1.0'
-            
-        # Add content type if not present for POST requests
-        if 'Content-Type' not in headers:
-            headers['Content-Type'] = 'application/json'
-            
-        # Add accept header for better API compatibility
-        if 'Accept' not in headers:
-            headers['Accept'] = 'application/json, text/plain, */*'
-            
-        # Add connection header for better reliability
-        if 'Connection' not in headers:
-            headers['Connection'] = 'keep-alive'
-            
-        return headers
-        
-    def enhance_http_node(self, node: Dict[str, Any]) -> bool:
-        """Enhance a single HTTP Request node with error handling"""
-        if node.get('type') != 'n8n-nodes-base.httpRequest':
-            return False
-            
-        parameters = node.get('parameters', {})
-        node_name = node.get('name', 'HTTP Request')
-        url = parameters.get('url', '')
-        
-        # Get current options or create new ones
-        options = parameters.get('options', {})
-        
-        # Add timeout configuration
-        timeout = self.get_timeout_config(node_name, url)
-        options['timeout'] = timeout
-        
-        # Add retry configuration
-        retry_config = self.get_retry_config(node_name, url)
-        options['retry'] = retry_config
-        
-        # Add response configuration
-        options['response'] = {
-            "response": {
-                "neverError": False
-            }
-        }
-        
-        # Add redirect configuration
-        options['redirect'] = {
-            "followRedirects": True,
-            "maxRedirects": 3
-        }
-        
-        # Enhance headers
-        existing_headers = parameters.get('headers', {})
-        enhanced_headers = self.get_enhanced_headers(existing_headers, url)
-        parameters['headers'] = enhanced_headers
-        
-        # Update parameters
-        parameters['options'] = options
-        node['parameters'] = parameters
-        
-        # Add error handling behavior
-        node['onError'] = 'continueRegularOutput'
-        
-        return True
-        
-    def add_error_handling_nodes(self, workflow: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Add error handling nodes to workflow"""
-        new_nodes = []
-        
-        # Find HTTP request nodes that need error handling
-        http_nodes = [node for node in workflow.get('nodes', []) 
-                     if node.get('type') == 'n8n-nodes-base.httpRequest']
-        
-        if not http_nodes:
-            return new_nodes
-            
-        # Create a global error handler node
-        error_handler_node = {
-            "parameters": {
-                "jsCode": '''
+    timeout = _match_rule(_TIMEOUT_RULES, node_keys, url_keys, 15000)
+    retry_config = _match_rule(_RETRY_RULES, node_keys, url_keys, _DEFAULT_RETRY)
+    specific = _match_rule(
+        _SPECIFIC_IMPROVEMENT_RULES, node_keys, url_keys,
+        "Added comprehensive error handling and retry logic"
+    )
+    
+    return timeout, retry_config, _timeout_reason(timeout), specific
+
+# Global Error Handler for HTTP Requests
+_ERROR_HANDLER_JS = '''
 // Global Error Handler for HTTP Requests
 const items = [];
 
@@ -244,20 +228,9 @@ if (isHttpError) {
 
 return items;
 '''
-            },
-            "id": "global-http-error-handler",
-            "name": "Global HTTP Error Handler",
-            "type": "n8n-nodes-base.code",
-            "typeVersion": 2,
-            "position": [1800, 300]
-        }
-        
-        new_nodes.append(error_handler_node)
-        
-        # Create fallback data provider node
-        fallback_node = {
-            "parameters": {
-                "jsCode": '''
+
+# Fallback Data Provider
+_FALLBACK_JS = '''
 // Fallback Data Provider
 const items = [];
 
@@ -296,114 +269,262 @@ if (nodeName.toLowerCase().includes('ai') || nodeName.toLowerCase().includes('op
 items.push(fallbackData);
 return items;
 '''
-            },
-            "id": "fallback-data-provider",
-            "name": "Fallback Data Provider", 
-            "type": "n8n-nodes-base.code",
-            "typeVersion": 2,
-            "position": [2000, 300]
-        }
+
+# Templates for the error handling nodes added to each workflow. Callers get a
+# shallow copy; the nested parameters/position values are shared and read-only.
+_ERROR_HANDLER_NODE = {
+    "parameters": {
+        "jsCode": _ERROR_HANDLER_JS
+    },
+    "id": "global-http-error-handler",
+    "name": "Global HTTP Error Handler",
+    "type": "n8n-nodes-base.code",
+    "typeVersion": 2,
+    "position": [1800, 300]
+}
+
+_FALLBACK_NODE = {
+    "parameters": {
+        "jsCode": _FALLBACK_JS
+    },
+    "id": "fallback-data-provider",
+    "name": "Fallback Data Provider",
+    "type": "n8n-nodes-base.code",
+    "typeVersion": 2,
+    "position": [2000, 300]
+}
+
+def _loads(data: bytes) -> Any:
+    """Parse workflow JSON, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize workflow JSON with 2-space indentation and a trailing newline
+    
+    Both paths write non-ASCII text as raw UTF-8 rather than \\u escapes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
+def _digest(data: bytes) -> str:
+    """Fast content hash used to detect edits that keep the same mtime and size"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _write_atomic(path: str, data: bytes, mode: Optional[int] = None) -> None:
+    """Write bytes to a temp file and rename it over path, so a crash never leaves a partial file
+    
+    Pass the original file's st_mode to keep its permissions, since the
+    rename replaces the file rather than rewriting it.
+    """
+    tmp_path = path + '.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        # os.chmod rather than os.fchmod, which Windows lacks before Python 3.13
+        if mode is not None:
+            os.chmod(tmp_path, stat.S_IMODE(mode))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+@dataclass(slots=True)
+class ImprovementRecord:
+    """Changes made to one workflow file, or why it was not enhanced"""
+    file: str
+    http_nodes_enhanced: int = 0
+    error_nodes_added: int = 0
+    timeout_configurations: List[Dict[str, Any]] = field(default_factory=list)
+    retry_configurations: List[Dict[str, Any]] = field(default_factory=list)
+    specific_improvements: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    skipped: bool = False
+    # blake2b hash of the file as left on disk, so callers can verify the
+    # written output without re-reading and re-parsing it
+    content_hash: Optional[str] = None
+
+class N8nWorkflowEnhancer:
+    """Enhances n8n workflows with robust error handling"""
+    
+    def __init__(self, workflows_dir: str, incremental: bool = True):
+        self.workflows_dir = workflows_dir
+        self.incremental = incremental
+        self.improvements_made = []
+        # File name -> [mtime_ns, size, content hash] as of the last run
+        self._cache: Dict[str, List[Any]] = {}
+        
+    def _classify(self, node_name: str, url: str) -> Tuple[int, Dict[str, Any], str, str]:
+        """Classify a node once into (timeout, retry config, timeout reason, specific improvement)"""
+        timeout, retry_config, reason, specific = _classify_lowered(
+            node_name.lower(), url.lower() if url else ""
+        )
+        return timeout, dict(retry_config), reason, specific
+        
+    def get_enhanced_headers(self, existing_headers: Any, url: str) -> Any:
+        """Add robust headers to HTTP requests, updating existing headers in place
+        
+        Headers that are set but not a dict (e.g. an n8n expression) are
+        returned unchanged rather than overwritten.
+        """
+        if isinstance(existing_headers, dict):
+            headers = existing_headers
+        elif not existing_headers:
+            headers = {}
+        else:
+            return existing_headers
         
-        new_nodes.append(fallback_node)
+        # Always add user agent if not present
+        headers.setdefault('User-Agent', 'n8n-workflow/1.0')
+        
+        # Add content type if not present for POST requests
+        headers.setdefault('Content-Type', 'application/json')
         
-        return new_nodes
+        # Add accept header for better API compatibility
+        headers.setdefault('Accept', 'application/json, text/plain, */*')
+        
+        # Add connection header for better reliability
+        headers.setdefault('Connection', 'keep-alive')
+            
+        return headers
+        
+    def enhance_http_node(self, node: Dict[str, Any]) -> Optional[Tuple[str, int, Dict[str, Any], str, str]]:
+        """Enhance a single HTTP Request node with error handling
+        
+        Returns (node name, timeout, retry config, timeout reason, specific
+        improvement) for the report, or None if the node is not an HTTP Request.
+        """
+        if node.get('type') != _HTTP_REQUEST_TYPE:
+            return None
+            
+        parameters = node.get('parameters', {})
+        node_name = node.get('name', 'HTTP Request')
+        url = parameters.get('url', '')
+        
+        # Get current options or create new ones
+        options = parameters.get('options', {})
+        
+        timeout, retry_config, reason, specific = self._classify(node_name, url)
+        
+        # Add timeout and retry configuration
+        options['timeout'] = timeout
+        options['retry'] = retry_config
         
-    def enhance_workflow(self, workflow_path: str) -> Dict[str, Any]:
+        # Add response and redirect configuration
+        options['response'] = _RESPONSE_OPTIONS
+        options['redirect'] = _REDIRECT_OPTIONS
+        
+        # Enhance headers
+        existing_headers = parameters.get('headers')
+        enhanced_headers = self.get_enhanced_headers(existing_headers, url)
+        if enhanced_headers is not existing_headers:
+            parameters['headers'] = enhanced_headers
+        elif not isinstance(existing_headers, dict):
+            logger.warning(f"Leaving non-dict headers of node '{node_name}' unchanged")
+        
+        # Update parameters
+        parameters['options'] = options
+        node['parameters'] = parameters
+        
+        # Add error handling behavior
+        node['onError'] = 'continueRegularOutput'
+        
+        return node_name, timeout, retry_config, reason, specific
+        
+    def add_error_handling_nodes(self, http_nodes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the error handling nodes needed by a workflow with these HTTP Request nodes"""
+        if not http_nodes:
+            return []
+            
+        # Global error handler and fallback data provider nodes
+        return [dict(_ERROR_HANDLER_NODE), dict(_FALLBACK_NODE)]
+        
+    def enhance_workflow(self, workflow_path: str) -> ImprovementRecord:
         """Enhance a single workflow file"""
-        logger.info(f"Enhancing workflow: {workflow_path}")
+        # Per-file lines are debug-only and formatted lazily, so hot runs skip them
+        logger.debug("Enhancing workflow: %s", workflow_path)
+        
+        file_name = os.path.basename(workflow_path)
         
         try:
-            # Load workflow
-            with open(workflow_path, 'r', encoding='utf-8') as f:
-                workflow = json.load(f)
+            # Load workflow, skipping it if unchanged since the last run
+            st = os.stat(workflow_path)
+            with open(workflow_path, 'rb') as f:
+                data = f.read()
+            cache_entry = [st.st_mtime_ns, st.st_size, _digest(data)]
+            if self.incremental and self._cache.get(file_name) == cache_entry:
+                return ImprovementRecord(file_name, skipped=True, content_hash=cache_entry[2])
+            workflow = _loads(data)
                 
-            improvements = {
-                'file': os.path.basename(workflow_path),
-                'http_nodes_enhanced': 0,
-                'error_nodes_added': 0,
-                'timeout_configurations': [],
-                'retry_configurations': [],
-                'specific_improvements': []
-            }
+            improvements = ImprovementRecord(file_name)
+            
+            # Find HTTP Request nodes once; both enhancement steps use them
+            http_nodes = [node for node in workflow.get('nodes', ())
+                          if node.get('type') == _HTTP_REQUEST_TYPE]
             
             # Enhance HTTP Request nodes
-            nodes = workflow.get('nodes', [])
-            for node in nodes:
-                if self.enhance_http_node(node):
-                    improvements['http_nodes_enhanced'] += 1
-                    node_name = node.get('name', 'HTTP Request')
-                    url = node.get('parameters', {}).get('url', '')
-                    timeout = node.get('parameters', {}).get('options', {}).get('timeout', 15000)
-                    retry_config = node.get('parameters', {}).get('options', {}).get('retry', {})
-                    
-                    improvements['timeout_configurations'].append({
-                        'node': node_name,
-                        'timeout': timeout,
-                        'reason': self._get_timeout_reason(node_name, url, timeout)
-                    })
-                    
-                    improvements['retry_configurations'].append({
-                        'node': node_name, 
-                        'max_attempts': retry_config.get('maxAttempts', 3),
-                        'wait_between': retry_config.get('waitBetween', 1500)
-                    })
-                    
-                    # Specific improvements based on node type
-                    improvements['specific_improvements'].append(
-                        self._get_specific_improvement(node_name, url)
-                    )
+            for node in http_nodes:
+                # Every node here is an HTTP Request, so this never returns None
+                node_name, timeout, retry_config, reason, specific = self.enhance_http_node(node)
+                improvements.http_nodes_enhanced += 1
+                
+                improvements.timeout_configurations.append({
+                    'node': node_name,
+                    'timeout': timeout,
+                    'reason': reason
+                })
+                
+                improvements.retry_configurations.append({
+                    'node': node_name, 
+                    'max_attempts': retry_config['maxAttempts'],
+                    'wait_between': retry_config['waitBetween']
+                })
+                
+                # Specific improvements based on node type
+                improvements.specific_improvements.append(specific)
             
             # Add error handling nodes
-            error_nodes = self.add_error_handling_nodes(workflow)
-            workflow['nodes'].extend(error_nodes)
-            improvements['error_nodes_added'] = len(error_nodes)
+            error_nodes = self.add_error_handling_nodes(http_nodes)
+            if error_nodes:
+                workflow['nodes'].extend(error_nodes)
+            improvements.error_nodes_added = len(error_nodes)
             
-            # Save enhanced workflow
-            with open(workflow_path, 'w', encoding='utf-8') as f:
-                json.dump(workflow, f, indent=2)
+            # Save enhanced workflow, leaving untouched files as they are
+            if improvements.http_nodes_enhanced or error_nodes:
+                data = _dumps(workflow)
+                _write_atomic(workflow_path, data, st.st_mode)
+                st = os.stat(workflow_path)
+                cache_entry = [st.st_mtime_ns, st.st_size, _digest(data)]
+            self._cache[file_name] = cache_entry
+            improvements.content_hash = cache_entry[2]
                 
-            logger.info(f"Enhanced {improvements['http_nodes_enhanced']} HTTP nodes in {workflow_path}")
+            logger.debug("Enhanced %d HTTP nodes in %s", improvements.http_nodes_enhanced, workflow_path)
             
             return improvements
             
         except Exception as e:
             logger.error(f"Error enhancing workflow {workflow_path}: {str(e)}")
-            return {'file': os.path.basename(workflow_path), 'error': str(e)}
-            
-    def _get_timeout_reason(self, node_name: str, url: str, timeout: int) -> str:
-        """Get human-readable reason for timeout configuration"""
-        if timeout >= 30000:
-            return "Extended timeout for AI/ML operations"
-        elif timeout >= 25000:
-            return "Long timeout for e-commerce API operations"
-        elif timeout >= 20000:
-            return "Medium timeout for social media APIs"
-        elif timeout >= 15000:
-            return "Standard timeout for webhook/dashboard operations"
-        else:
-            return "Quick timeout for simple operations"
-            
-    def _get_specific_improvement(self, node_name: str, url: str) -> str:
-        """Get specific improvement description for node"""
-        node_lower = node_name.lower()
-        url_lower = url.lower() if url else ""
-        
-        if 'openai' in node_lower or 'gpt' in node_lower:
-            return "Added cost-aware retry logic for AI API calls"
-        elif 'email' in node_lower or 'sendgrid' in node_lower:
-            return "Enhanced email delivery reliability with retry logic"
-        elif 'slack' in node_lower or 'slack' in url_lower:
-            return "Improved Slack notification reliability"
-        elif any(keyword in url_lower for keyword in ['shopify', 'amazon', 'ebay']):
-            return "Added robust error handling for e-commerce API integration"
-        elif 'webhook' in node_lower or 'callback' in node_lower:
-            return "Enhanced webhook reliability with proper timeout and retry"
-        else:
-            return "Added comprehensive error handling and retry logic"
+            # A failed file must be retried next run, so forget its old entry
+            self._cache.pop(file_name, None)
+            return ImprovementRecord(file_name, error=str(e))
             
-    def enhance_all_workflows(self) -> List[Dict[str, Any]]:
+    def enhance_all_workflows(self) -> List[ImprovementRecord]:
         """Enhance all workflow files in the directory"""
-        workflow_files = glob.glob(os.path.join(self.workflows_dir, "*.json"))
+        # Like glob("*.json"), skip hidden files
+        with os.scandir(self.workflows_dir) as entries:
+            workflow_files = [
+                entry.path for entry in entries
+                if entry.name.endswith('.json') and not entry.name.startswith('.')
+                and entry.is_file(follow_symlinks=False)
+            ]
         
         if not workflow_files:
             logger.warning(f"No JSON files found in {self.workflows_dir}")
@@ -411,28 +532,70 @@ return items;
             
         logger.info(f"Found {len(workflow_files)} workflow files to enhance")
         
-        all_improvements = []
+        if self.incremental:
+            self._cache = self._load_cache()
+            cache_entries = [self._cache.get(os.path.basename(path)) for path in workflow_files]
+        else:
+            cache_entries = [None] * len(workflow_files)
         
-        for workflow_file in workflow_files:
-            improvements = self.enhance_workflow(workflow_file)
-            all_improvements.append(improvements)
+        # Each file is enhanced independently, so fan the work out across cores
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_enhance_one, workflow_files, cache_entries, chunksize=4))
+            
+        all_improvements = [improvements for improvements, _ in results]
+        
+        enhanced = sum(1 for imp in all_improvements if imp.error is None and not imp.skipped)
+        skipped = sum(1 for imp in all_improvements if imp.skipped)
+        logger.info(
+            "Enhanced %d/%d workflows (%d unchanged), %d HTTP nodes",
+            enhanced, len(all_improvements), skipped,
+            sum(imp.http_nodes_enhanced for imp in all_improvements)
+        )
+        
+        if self.incremental:
+            # Entries for files that failed or no longer exist are dropped
+            self._cache = {
+                improvements.file: cache_entry
+                for improvements, cache_entry in results if cache_entry is not None
+            }
+            self._save_cache()
             
         return all_improvements
         
-    def generate_summary_report(self, improvements: List[Dict[str, Any]]) -> str:
+    def _load_cache(self) -> Dict[str, List[Any]]:
+        """Load the incremental cache, treating a missing or corrupt file as empty"""
+        try:
+            with open(os.path.join(self.workflows_dir, _CACHE_FILE), 'rb') as f:
+                cache = _loads(f.read())
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.warning(f"Ignoring unreadable cache {_CACHE_FILE}: {str(e)}")
+            return {}
+        return cache if isinstance(cache, dict) else {}
+        
+    def _save_cache(self) -> None:
+        """Persist the incremental cache next to the workflows"""
+        try:
+            _write_atomic(os.path.join(self.workflows_dir, _CACHE_FILE), _dumps(self._cache))
+        except OSError as e:
+            logger.warning(f"Could not save cache {_CACHE_FILE}: {str(e)}")
+        
+    def generate_summary_report(self, improvements: List[ImprovementRecord]) -> str:
         """Generate a comprehensive summary report"""
         total_files = len(improvements)
-        total_http_nodes = sum(imp.get('http_nodes_enhanced', 0) for imp in improvements)
-        total_error_nodes = sum(imp.get('error_nodes_added', 0) for imp in improvements)
+        total_http_nodes = sum(imp.http_nodes_enhanced for imp in improvements)
+        total_error_nodes = sum(imp.error_nodes_added for imp in improvements)
+        total_skipped = sum(1 for imp in improvements if imp.skipped)
         
-        report = f"""
+        parts = [f"""
 # N8n Workflow Error Handling Enhancement Report
 
 ## Summary
 - **Total workflow files processed**: {total_files}
 - **Total HTTP Request nodes enhanced**: {total_http_nodes}
 - **Total error handling nodes added**: {total_error_nodes}
-- **Success rate**: {len([i for i in improvements if 'error' not in i]) / total_files * 100:.1f}%
+- **Unchanged files skipped**: {total_skipped}
+- **Success rate**: {sum(1 for i in improvements if i.error is None) / total_files * 100:.1f}%
 
 ## Enhanced Features Added to Each Workflow:
 
@@ -451,36 +614,41 @@ return items;
 
 ## Detailed File Improvements:
 
-"""
+"""]
+        append = parts.append
         
         for improvement in improvements:
-            if 'error' in improvement:
-                report += f"### ❌ {improvement['file']} (FAILED)\n"
-                report += f"- **Error**: {improvement['error']}\n\n"
+            if improvement.error is not None:
+                append(f"### ❌ {improvement.file} (FAILED)\n")
+                append(f"- **Error**: {improvement.error}\n\n")
                 continue
                 
-            report += f"### ✅ {improvement['file']}\n"
-            report += f"- **HTTP nodes enhanced**: {improvement.get('http_nodes_enhanced', 0)}\n"
-            report += f"- **Error nodes added**: {improvement.get('error_nodes_added', 0)}\n"
+            if improvement.skipped:
+                append(f"### ⏭️ {improvement.file} (unchanged since last run)\n\n")
+                continue
+                
+            append(f"### ✅ {improvement.file}\n")
+            append(f"- **HTTP nodes enhanced**: {improvement.http_nodes_enhanced}\n")
+            append(f"- **Error nodes added**: {improvement.error_nodes_added}\n")
             
-            if improvement.get('timeout_configurations'):
-                report += "- **Timeout configurations**:\n"
-                for config in improvement['timeout_configurations']:
-                    report += f"  - `{config['node']}`: {config['timeout']/1000}s ({config['reason']})\n"
+            if improvement.timeout_configurations:
+                append("- **Timeout configurations**:\n")
+                for config in improvement.timeout_configurations:
+                    append(f"  - `{config['node']}`: {config['timeout']/1000}s ({config['reason']})\n")
                     
-            if improvement.get('retry_configurations'):
-                report += "- **Retry configurations**:\n"
-                for config in improvement['retry_configurations']:
-                    report += f"  - `{config['node']}`: {config['max_attempts']} attempts, {config['wait_between']/1000}s intervals\n"
+            if improvement.retry_configurations:
+                append("- **Retry configurations**:\n")
+                for config in improvement.retry_configurations:
+                    append(f"  - `{config['node']}`: {config['max_attempts']} attempts, {config['wait_between']/1000}s intervals\n")
                     
-            if improvement.get('specific_improvements'):
-                report += "- **Specific improvements**:\n"
-                for imp in improvement['specific_improvements']:
-                    report += f"  - {imp}\n"
+            if improvement.specific_improvements:
+                append("- **Specific improvements**:\n")
+                for imp in improvement.specific_improvements:
+                    append(f"  - {imp}\n")
                     
-            report += "\n"
+            append("\n")
             
-        report += """
+        append("""
 ## Key Production Benefits:
 
 ### Reliability Improvements
@@ -528,9 +696,21 @@ return items;
 - **Resource Usage**: Error handling nodes consume additional execution resources
 
 The enhanced error handling significantly improves production reliability while maintaining cost efficiency through intelligent retry strategies and fallback mechanisms.
-"""
+""")
         
-        return report
+        return "".join(parts)
+
+def _enhance_one(workflow_path: str, cache_entry: Optional[List[Any]]) -> Tuple[ImprovementRecord, Optional[List[Any]]]:
+    """Process pool entry point: enhance one workflow with a worker-local enhancer
+    
+    Returns the improvements and the file's refreshed cache entry.
+    """
+    file_name = os.path.basename(workflow_path)
+    enhancer = N8nWorkflowEnhancer(os.path.dirname(workflow_path))
+    if cache_entry is not None:
+        enhancer._cache[file_name] = cache_entry
+    improvements = enhancer.enhance_workflow(workflow_path)
+    return improvements, enhancer._cache.get(file_name)
 
 def main():
     """Main function to run the workflow enhancement"""